@@ -0,0 +1,13 @@
+from time import time_ns
+
+from django.core.cache import cache
+
+POST_PAGES_VERSION_KEY = 'blog:post_pages_version'
+
+
+def get_post_pages_version():
+    return cache.get_or_set(POST_PAGES_VERSION_KEY, time_ns, None)
+
+
+def invalidate_post_pages():
+    cache.set(POST_PAGES_VERSION_KEY, time_ns(), None)
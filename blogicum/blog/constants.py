@@ -1 +1,18 @@
 NUMBER_OF_PUBLICATIONS = 10
+POST_PAGES_CACHE_TIMEOUT = 60
+STREAM_CHUNK_SIZE = 500
+POST_CARD_FIELDS = (
+    'id',
+    'title',
+    'text',
+    'pub_date',
+    'image',
+    'is_published',
+    'comment_count',
+    'author__username',
+    'category__slug',
+    'category__title',
+    'category__is_published',
+    'location__name',
+    'location__is_published',
+)
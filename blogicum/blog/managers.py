@@ -1,20 +1,28 @@
 from django.db import models
-from django.db.models import Count
 from django.utils import timezone
 
+from .constants import POST_CARD_FIELDS, STREAM_CHUNK_SIZE
 
-class PostManager(models.Manager):
-    def get_queryset(self):
-        result = super().get_queryset()
-        return result.select_related(
+
+class PostQuerySet(models.QuerySet):
+    def with_related(self):
+        return self.select_related(
             'category',
             'author',
-        ).filter(
+            'location',
+        )
+
+    def for_cards(self):
+        return self.with_related().only(
+            *POST_CARD_FIELDS,
+        )
+
+    def published(self, now=None):
+        return self.filter(
             is_published=True,
-            category__is_published=True,
-            pub_date__lt=timezone.now(),
-        ).order_by(
-            '-pub_date',
-        ).annotate(
-            comment_count=Count('comments'),
+            category_is_published=True,
+            pub_date__lt=now or timezone.now(),
         )
+
+    def stream(self, chunk_size=STREAM_CHUNK_SIZE):
+        return self.iterator(chunk_size=chunk_size)
@@ -0,0 +1,38 @@
+# Generated by Django 3.2.16 on 2026-10-14 07:13
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_comment_count(apps, schema_editor):
+    Comment = apps.get_model('blog', 'Comment')
+    Post = apps.get_model('blog', 'Post')
+    comment_count = Comment.objects.filter(
+        post=OuterRef('pk'),
+    ).values(
+        'post',
+    ).annotate(
+        count=Count('pk'),
+    ).values(
+        'count',
+    )
+    Post.objects.update(
+        comment_count=Coalesce(Subquery(comment_count), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_post_category_pub_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество комментариев'),
+        ),
+        migrations.RunPython(fill_comment_count, migrations.RunPython.noop),
+    ]
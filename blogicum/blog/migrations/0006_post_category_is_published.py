@@ -0,0 +1,40 @@
+# Generated by Django 3.2.16 on 2026-10-14 07:16
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+
+
+def fill_category_is_published(apps, schema_editor):
+    Category = apps.get_model('blog', 'Category')
+    Post = apps.get_model('blog', 'Post')
+    Post.objects.update(
+        category_is_published=Exists(
+            Category.objects.filter(
+                pk=OuterRef('category_id'),
+                is_published=True,
+            ),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_post_comment_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='category_is_published',
+            field=models.BooleanField(default=True, editable=False, verbose_name='Категория опубликована'),
+        ),
+        migrations.RunPython(
+            fill_category_is_published,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('category_is_published', True), ('is_published', True)), fields=['-pub_date', '-id'], name='post_published_pub_date_idx'),
+        ),
+    ]
@@ -2,7 +2,7 @@ from core.models import CreatedAt, PublishedModel
 from django.contrib.auth import get_user_model
 from django.db import models
 
-from .managers import PostManager
+from .managers import PostQuerySet
 
 User = get_user_model()
 
@@ -74,16 +74,88 @@ class Post(PublishedModel, CreatedAt):
         verbose_name='Фото',
         blank=True,
     )
+    category_is_published = models.BooleanField(
+        default=True,
+        editable=False,
+        verbose_name='Категория опубликована',
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев',
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=models.Q(
+                    is_published=True,
+                    category_is_published=True,
+                ),
+                name='post_published_pub_date_idx',
+            ),
+            models.Index(
+                fields=('category', '-pub_date', '-id'),
+                name='post_category_pub_date_idx',
+            ),
+        )
+
+    denormalized_fields = (
+        'category_is_published',
+        'comment_count',
+    )
 
     def __str__(self):
         return self.title
 
-    objects = models.Manager()
-    manager = PostManager()
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_category_id = instance.__dict__.get('category_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        # Денормализованные поля не перезаписываются значениями из памяти.
+        if (
+            update_fields is None
+            and self.pk is not None
+            and not self._state.adding
+        ):
+            deferred = self.get_deferred_fields()
+            update_fields = kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in self.denormalized_fields
+            ]
+        category_changed = (
+            self._state.adding
+            or self.category_id != getattr(self, '_loaded_category_id', None)
+        )
+        if category_changed and (
+            update_fields is None
+            or {'category', 'category_id'} & set(update_fields)
+        ):
+            self.category_is_published = (
+                self.category_id is not None
+                and Category.objects.filter(
+                    pk=self.category_id,
+                    is_published=True,
+                ).exists()
+            )
+            if update_fields is not None:
+                kwargs['update_fields'] = {
+                    *update_fields,
+                    'category_is_published',
+                }
+        super().save(*args, **kwargs)
+        self._loaded_category_id = self.category_id
+
+    objects = PostQuerySet.as_manager()
 
 
 class Comment(models.Model):
@@ -105,3 +177,9 @@ class Comment(models.Model):
         ordering = (
             'created_at',
         )
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at'),
+                name='comment_post_created_idx',
+            ),
+        )
@@ -0,0 +1,51 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Sequence
+from datetime import datetime
+
+from django.http import Http404
+from django.utils import timezone
+
+MAX_CURSOR_PK = 2 ** 63
+
+
+def encode_cursor(post):
+    value = f'{post.pub_date.isoformat()}|{post.pk}'
+    return urlsafe_b64encode(value.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        pub_date, pk = urlsafe_b64decode(cursor.encode()).decode().split('|')
+        pub_date, pk = datetime.fromisoformat(pub_date), int(pk)
+    except ValueError:
+        raise Http404('Invalid cursor')
+    if timezone.is_naive(pub_date) or not 1 <= pk < MAX_CURSOR_PK:
+        raise Http404('Invalid cursor')
+    try:
+        return pub_date.astimezone(timezone.utc), pk
+    except OverflowError:
+        raise Http404('Invalid cursor')
+
+
+class KeysetPage(Sequence):
+    """Страница выборки, полученная по курсору (pub_date, id)."""
+
+    def __init__(self, object_list, next_cursor=None, is_first=True):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.is_first = is_first
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return not self.is_first
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
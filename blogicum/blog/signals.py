@@ -0,0 +1,49 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .cache import invalidate_post_pages
+from .models import Category, Comment, Location, Post
+
+
+@receiver(post_save, sender=Comment)
+def increase_comment_count(sender, instance, created, raw, **kwargs):
+    if created and not raw:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1,
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comment_count(sender, instance, **kwargs):
+    Post.objects.filter(pk=instance.post_id).update(
+        comment_count=Greatest(F('comment_count') - 1, 0),
+    )
+
+
+@receiver(post_save, sender=Category)
+def update_category_is_published(sender, instance, created, raw, **kwargs):
+    if not created and not raw:
+        Post.objects.filter(category=instance).update(
+            category_is_published=instance.is_published,
+        )
+
+
+@receiver(pre_delete, sender=Category)
+def reset_category_is_published(sender, instance, **kwargs):
+    Post.objects.filter(category=instance).update(
+        category_is_published=False,
+    )
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Comment)
+@receiver(post_save, sender=Location)
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Comment)
+@receiver(post_delete, sender=Location)
+@receiver(post_delete, sender=Post)
+def reset_post_pages_cache(sender, **kwargs):
+    invalidate_post_pages()
@@ -1,15 +1,28 @@
+from threading import local
+
+from core.time import request_now
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count
-from django.http import Http404
+from django.core.cache import cache
+from django.db.models import Prefetch, Q
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
-from django.utils import timezone
 from django.views.generic import (CreateView, DeleteView, DetailView, ListView,
                                   UpdateView)
 
-from .constants import NUMBER_OF_PUBLICATIONS
+from .cache import get_post_pages_version
+from .constants import NUMBER_OF_PUBLICATIONS, POST_PAGES_CACHE_TIMEOUT
 from .forms import CommentForm, PostForm, UserForm
 from .models import Category, Comment, Post, User
+from .paginators import KeysetPage, decode_cursor, encode_cursor
+
+_forms = local()
+
+
+def _empty_comment_form():
+    """Пустая форма комментария, одна на поток."""
+    if not hasattr(_forms, 'comment'):
+        _forms.comment = CommentForm()
+    return _forms.comment
 
 
 class PostReverseMixin:
@@ -26,7 +39,7 @@ class ProfileReverseMixin:
     def get_success_url(self):
         return reverse_lazy(
             'blog:profile',
-            args=[self.request.user],
+            kwargs={'username': self.request.user.username},
         )
 
 
@@ -36,11 +49,17 @@ class PostMixin:
     pk_url_kwarg = 'post_id'
 
     def dispatch(self, request, *args, **kwargs):
-        post = get_object_or_404(Post, pk=kwargs['post_id'])
-        if post.author != request.user:
+        self.object = get_object_or_404(
+            Post.objects.select_related('author'),
+            pk=kwargs['post_id'],
+        )
+        if self.object.author != request.user:
             return redirect('blog:post_detail', post_id=self.kwargs['post_id'])
         return super().dispatch(request, *args, **kwargs)
 
+    def get_object(self, queryset=None):
+        return self.object
+
 
 class CommentMixin:
     model = Comment
@@ -49,16 +68,68 @@ class CommentMixin:
     pk_url_kwarg = 'comment_id'
 
     def dispatch(self, request, *args, **kwargs):
-        comment = get_object_or_404(Comment, pk=kwargs['comment_id'])
-        if comment.author != request.user:
+        self.object = get_object_or_404(
+            Comment.objects.select_related('author', 'post'),
+            pk=kwargs['comment_id'],
+        )
+        if self.object.author != request.user:
             return redirect('blog:post_detail', post_id=self.kwargs['post_id'])
         return super().dispatch(request, *args, **kwargs)
 
+    def get_object(self, queryset=None):
+        return self.object
+
 
-class IndexListView(ListView):
-    queryset = Post.manager.all()
-    template_name = 'blog/index.html'
+class KeysetPaginationMixin:
     paginate_by = NUMBER_OF_PUBLICATIONS
+    cursor_kwarg = 'after'
+
+    def get_page_cache_key(self, cursor):
+        position = ''
+        if cursor:
+            pub_date, pk = cursor
+            position = f'{pub_date:%Y%m%d%H%M%S%f}-{pk}'
+        return ':'.join((
+            'blog:post_page',
+            str(get_post_pages_version()),
+            self.request.path,
+            position,
+        ))
+
+    def paginate_queryset(self, queryset, page_size):
+        cursor = self.request.GET.get(self.cursor_kwarg)
+        if cursor:
+            cursor = decode_cursor(cursor)
+        object_list, next_cursor = cache.get_or_set(
+            self.get_page_cache_key(cursor),
+            lambda: self.get_keyset_page(queryset, page_size, cursor),
+            POST_PAGES_CACHE_TIMEOUT,
+        )
+        page = KeysetPage(object_list, next_cursor, is_first=not cursor)
+        return None, page, object_list, page.has_other_pages()
+
+    def get_keyset_page(self, queryset, page_size, cursor):
+        queryset = queryset.order_by('-pub_date', '-id')
+        if cursor:
+            pub_date, pk = cursor
+            queryset = queryset.filter(
+                Q(pub_date__lt=pub_date) | Q(pub_date=pub_date, id__lt=pk)
+            )
+        object_list = list(queryset[:page_size + 1])
+        next_cursor = None
+        if len(object_list) > page_size:
+            object_list = object_list[:page_size]
+            next_cursor = encode_cursor(object_list[-1])
+        return object_list, next_cursor
+
+
+class IndexListView(KeysetPaginationMixin, ListView):
+    template_name = 'blog/index.html'
+
+    def get_queryset(self):
+        return Post.objects.for_cards().published(
+            request_now(self.request),
+        )
 
 
 class PostDetailView(DetailView):
@@ -66,72 +137,95 @@ class PostDetailView(DetailView):
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_id'
 
+    def get_queryset(self):
+        visible = Q(
+            is_published=True,
+            category_is_published=True,
+            pub_date__lte=request_now(self.request),
+        )
+        if self.request.user.is_authenticated:
+            visible |= Q(author=self.request.user)
+        return Post.objects.with_related().prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related('author'),
+            ),
+        ).filter(
+            visible,
+        )
+
     def dispatch(self, request, *args, **kwargs):
-        post = get_object_or_404(Post, id=kwargs['post_id'])
-        if post.author == request.user or (
-            post.is_published and post.pub_date <= timezone.now()
-            and post.category.is_published
-        ):
-            return super().dispatch(request, *args, **kwargs)
-        raise Http404('Post not found')
+        self.object = self.get_object()
+        return super().dispatch(request, *args, **kwargs)
+
+    def get(self, request, *args, **kwargs):
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['form'] = CommentForm()
-        context['comments'] = self.object.comments.select_related('author')
+        context['form'] = _empty_comment_form()
+        context['comments'] = self.object.comments.all()
         return context
 
 
-class CategoryPostsListView(ListView):
+class CategoryPostsListView(KeysetPaginationMixin, ListView):
     template_name = 'blog/category.html'
-    paginate_by = NUMBER_OF_PUBLICATIONS
 
     def get_queryset(self):
-        return Post.manager.filter(
-            category__slug=self.kwargs['category_slug'],
+        self.category = get_object_or_404(
+            Category.objects.only(
+                'id',
+                'title',
+                'description',
+                'slug',
+                'is_published',
+            ),
+            slug=self.kwargs['category_slug'],
+            is_published=True,
+        )
+        return Post.objects.for_cards().published(
+            request_now(self.request),
+        ).filter(
+            category_id=self.category.id,
         )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['category'] = get_object_or_404(
-            Category,
-            slug=self.kwargs['category_slug'],
-            is_published=True,
-        )
+        context['category'] = self.category
         return context
 
 
-class ProfileListView(ListView):
+class ProfileListView(KeysetPaginationMixin, ListView):
     model = User
     template_name = 'blog/profile.html'
-    paginate_by = NUMBER_OF_PUBLICATIONS
 
     def get_queryset(self):
-        posts = Post.objects.select_related(
-            'category',
-            'author',
-            'location',
-        ).filter(
-            author__username=self.kwargs['username'],
-        ).order_by(
-            '-pub_date',
-        ).annotate(
-            comment_count=Count('comments'),
+        self.profile = get_object_or_404(
+            User.objects.only(
+                'id',
+                'username',
+                'first_name',
+                'last_name',
+                'date_joined',
+                'is_staff',
+            ),
+            username=self.kwargs['username'],
         )
-        if self.request.user.username != self.kwargs['username']:
-            posts = posts.filter(
-                is_published=True,
-                category__is_published=True,
-                pub_date__lt=timezone.now(),
-            )
+        posts = Post.objects.for_cards().filter(
+            author_id=self.profile.id,
+        )
+        if self.request.user != self.profile:
+            posts = posts.published(request_now(self.request))
         return posts
 
+    def get_page_cache_key(self, cursor):
+        is_owner = self.request.user == self.profile
+        return f'{super().get_page_cache_key(cursor)}:{is_owner:d}'
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['profile'] = get_object_or_404(
-            User,
-            username=self.kwargs['username'],
-        )
+        context['profile'] = self.profile
         return context
 
 
@@ -143,13 +237,6 @@ class ProfileUpdateView(ProfileReverseMixin, LoginRequiredMixin, UpdateView):
     def get_object(self, queryset=None):
         return self.request.user
 
-    def dispatch(self, request, *args, **kwargs):
-        get_object_or_404(
-            User,
-            id=request.user.pk,
-        )
-        return super().dispatch(request, *args, **kwargs)
-
 
 class PostCreateView(ProfileReverseMixin, LoginRequiredMixin, CreateView):
     model = Post
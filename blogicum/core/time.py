@@ -0,0 +1,8 @@
+from django.utils import timezone
+
+
+def request_now(request):
+    """Текущее время, вычисленное один раз за запрос."""
+    if not hasattr(request, '_now'):
+        request._now = timezone.now()
+    return request._now
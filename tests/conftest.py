@@ -10,6 +10,7 @@ from typing import (Any, Iterable, List, NamedTuple, Optional, Tuple, Type,
 import pytest
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db.models import Field, Model
 from django.forms import BaseForm
 from django.http import HttpResponse
@@ -32,6 +33,18 @@ def enable_debug_false():
         yield
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache():
+    locmem = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+    with override_settings(CACHES=locmem):
+        cache.clear()
+        yield
+
+
 class SafeImportFromContextManager:
     def __init__(
             self,
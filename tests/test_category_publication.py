@@ -0,0 +1,118 @@
+from http import HTTPStatus
+
+import pytest
+from blog.models import Category, Post
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def get_category_is_published(post):
+    post.refresh_from_db(fields=["category_is_published"])
+    return post.category_is_published
+
+
+def index_post_ids(client):
+    return [post.id for post in client.get("/").context["page_obj"]]
+
+
+@pytest.mark.django_db
+def test_unpublished_category_hides_posts(
+    another_user_client, post_with_published_location
+):
+    post = post_with_published_location
+    category = post.category
+    assert post.id in index_post_ids(another_user_client)
+
+    category.is_published = False
+    category.save()
+    assert not get_category_is_published(post)
+    assert post.id not in index_post_ids(another_user_client), (
+        "Убедитесь, что публикации категории, снятой с публикации, "
+        "не отображаются на главной странице."
+    )
+    response = another_user_client.get(f"/posts/{post.id}/")
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+    category.is_published = True
+    category.save()
+    assert get_category_is_published(post)
+    assert post.id in index_post_ids(another_user_client)
+
+
+@pytest.mark.django_db
+def test_stale_post_save_keeps_category_flag(
+    another_user_client, post_with_published_location
+):
+    stale_post = Post.objects.get(pk=post_with_published_location.pk)
+    category = Category.objects.get(pk=stale_post.category_id)
+    category.is_published = False
+    category.save()
+
+    stale_post.title = "Новый заголовок"
+    stale_post.save()
+    assert not get_category_is_published(stale_post), (
+        "Убедитесь, что сохранение публикации, загруженной до снятия "
+        "категории с публикации, не возвращает её в ленту."
+    )
+    assert stale_post.id not in index_post_ids(another_user_client)
+
+
+@pytest.mark.django_db
+def test_deleted_category_hides_posts(
+    another_user_client, post_with_published_location
+):
+    post = post_with_published_location
+    post.category.delete()
+    assert not get_category_is_published(post)
+    assert post.id not in index_post_ids(another_user_client), (
+        "Убедитесь, что публикации удалённой категории "
+        "не отображаются на главной странице."
+    )
+
+
+@pytest.mark.django_db
+def test_category_change_updates_flag(
+    mixer, post_with_published_location, published_category
+):
+    post = post_with_published_location
+    unpublished_category = mixer.blend("blog.Category", is_published=False)
+
+    post.category = unpublished_category
+    post.save(update_fields=["category"])
+    assert not get_category_is_published(post)
+
+    post.category = published_category
+    post.save()
+    assert get_category_is_published(post)
+
+
+@pytest.mark.django_db
+def test_post_save_skips_category_lookup(post_with_published_location):
+    post = Post.objects.get(pk=post_with_published_location.pk)
+    post.title = "Новый заголовок"
+    with CaptureQueriesContext(connection) as context:
+        post.save()
+    assert not any(
+        "blog_category" in query["sql"] for query in context.captured_queries
+    )
+
+
+@pytest.mark.django_db
+def test_loaddata_keeps_category_flag(
+    mixer, user, published_category, tmp_path
+):
+    published_post = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+    )
+    unpublished_post = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=mixer.blend("blog.Category", is_published=False),
+    )
+    fixture = tmp_path / "blog.json"
+    call_command("dumpdata", "blog", output=str(fixture))
+    Post.objects.all().delete()
+    call_command("loaddata", str(fixture), verbosity=0)
+    assert get_category_is_published(published_post)
+    assert not get_category_is_published(unpublished_post)
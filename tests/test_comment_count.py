@@ -0,0 +1,79 @@
+from importlib import import_module
+
+import pytest
+from blog.models import Post
+from django.apps import apps
+from django.core.management import call_command
+
+
+def get_comment_count(post):
+    post.refresh_from_db(fields=["comment_count"])
+    return post.comment_count
+
+
+@pytest.mark.django_db
+def test_comment_count_follows_comments(mixer, post_with_published_location):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend("blog.Comment", post=post)
+    assert get_comment_count(post) == 3, (
+        "Убедитесь, что при создании комментария счётчик комментариев "
+        "публикации увеличивается."
+    )
+    comments[0].text = "Изменённый текст"
+    comments[0].save()
+    assert get_comment_count(post) == 3, (
+        "Убедитесь, что редактирование комментария не меняет счётчик."
+    )
+    comments[1].delete()
+    assert get_comment_count(post) == 2, (
+        "Убедитесь, что при удалении комментария счётчик комментариев "
+        "публикации уменьшается."
+    )
+
+
+@pytest.mark.django_db
+def test_stale_post_save_keeps_comment_count(
+    mixer, post_with_published_location
+):
+    stale_post = Post.objects.get(pk=post_with_published_location.pk)
+    mixer.blend("blog.Comment", post=stale_post)
+    stale_post.title = "Новый заголовок"
+    stale_post.save()
+    assert get_comment_count(stale_post) == 1, (
+        "Убедитесь, что сохранение публикации не перезаписывает "
+        "счётчик комментариев устаревшим значением."
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_is_not_negative(mixer, post_with_published_location):
+    post = post_with_published_location
+    comment = mixer.blend("blog.Comment", post=post)
+    Post.objects.filter(pk=post.pk).update(comment_count=0)
+    comment.delete()
+    assert get_comment_count(post) == 0
+
+
+@pytest.mark.django_db
+def test_comment_count_survives_loaddata(
+    mixer, post_with_published_location, tmp_path
+):
+    post = post_with_published_location
+    mixer.cycle(3).blend("blog.Comment", post=post)
+    fixture = tmp_path / "blog.json"
+    call_command("dumpdata", "blog", output=str(fixture))
+    Post.objects.all().delete()
+    call_command("loaddata", str(fixture), verbosity=0)
+    assert get_comment_count(post) == 3, (
+        "Убедитесь, что загрузка фикстур не меняет счётчик комментариев."
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_backfill(mixer, post_with_published_location):
+    post = post_with_published_location
+    mixer.cycle(2).blend("blog.Comment", post=post)
+    Post.objects.update(comment_count=0)
+    migration = import_module("blog.migrations.0005_post_comment_count")
+    migration.fill_comment_count(apps, None)
+    assert get_comment_count(post) == 2
@@ -0,0 +1,71 @@
+from base64 import urlsafe_b64encode
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+import pytz
+from conftest import N_PER_PAGE
+
+
+def make_cursor(value):
+    return urlsafe_b64encode(value.encode()).decode()
+
+
+@pytest.fixture
+def posts_with_equal_pub_dates(mixer, user, published_category):
+    base = datetime.now(tz=pytz.UTC) - timedelta(days=1)
+    pub_dates = (base - timedelta(hours=i % 4) for i in range(28))
+    return mixer.cycle(28).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        pub_date=pub_dates,
+    )
+
+
+def walk_pages(client, url):
+    seen, pages = [], 0
+    cursor = None
+    while True:
+        response = client.get(url, {"after": cursor} if cursor else {})
+        assert response.status_code == HTTPStatus.OK
+        page = response.context["page_obj"]
+        assert len(page) <= N_PER_PAGE
+        seen.extend(page)
+        pages += 1
+        if not page.has_next():
+            return seen, pages
+        cursor = page.next_cursor
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ("/", "/category/{slug}/", "/profile/{user}/"))
+def test_pages_cover_all_posts(
+    client, user, published_category, posts_with_equal_pub_dates, url
+):
+    url = url.format(slug=published_category.slug, user=user.username)
+    seen, pages = walk_pages(client, url)
+    assert pages == 3
+    assert len(seen) == len({post.id for post in seen}), (
+        "Убедитесь, что публикации не повторяются на разных страницах."
+    )
+    assert {post.id for post in seen} == {
+        post.id for post in posts_with_equal_pub_dates
+    }, "Убедитесь, что при пагинации не пропускаются публикации."
+    keys = [(post.pub_date, post.id) for post in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("cursor", (
+    "zzz",
+    make_cursor("not a cursor"),
+    make_cursor("2023-01-01T00:00:00+00:00|abc"),
+    make_cursor("2023-01-01T00:00:00|1"),
+    make_cursor("2023-01-01T00:00:00+00:00|0"),
+    make_cursor("2023-01-01T00:00:00+00:00|99999999999999999999999"),
+    make_cursor("0001-01-01T00:00:00+05:00|1"),
+))
+def test_invalid_cursor_returns_404(client, cursor):
+    response = client.get("/", {"after": cursor})
+    assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,82 @@
+from datetime import timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from blog.paginators import decode_cursor, encode_cursor
+from conftest import N_PER_PAGE
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def get_index(client):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/")
+    post_queries = [
+        query for query in context.captured_queries
+        if 'FROM "blog_post"' in query["sql"]
+    ]
+    return response, post_queries
+
+
+@pytest.mark.django_db
+def test_index_page_is_cached(client, post_with_published_location):
+    response, post_queries = get_index(client)
+    assert list(response.context["page_obj"]) == [post_with_published_location]
+    assert post_queries
+
+    response, post_queries = get_index(client)
+    assert list(response.context["page_obj"]) == [post_with_published_location]
+    assert not post_queries, (
+        "Убедитесь, что повторный запрос главной страницы "
+        "берёт публикации из кэша."
+    )
+
+
+@pytest.mark.django_db
+def test_post_save_resets_cache(client, post_with_published_location):
+    post = post_with_published_location
+    get_index(client)
+    post.title = "Новый заголовок"
+    post.save()
+    response, post_queries = get_index(client)
+    assert post_queries
+    assert response.context["page_obj"][0].title == "Новый заголовок"
+
+
+@pytest.mark.django_db
+def test_comment_save_resets_cache(
+    client, mixer, post_with_published_location
+):
+    get_index(client)
+    mixer.blend("blog.Comment", post=post_with_published_location)
+    response, post_queries = get_index(client)
+    assert post_queries
+    assert response.context["page_obj"][0].comment_count == 1
+
+
+@pytest.mark.django_db
+def test_equal_cursors_share_cache_key(
+    client, mixer, user, published_category
+):
+    mixer.cycle(N_PER_PAGE + 1).blend(
+        "blog.Post", author=user, category=published_category,
+    )
+    cursor = get_index(client)[0].context["page_obj"].next_cursor
+    client.get("/", {"after": cursor})
+
+    pub_date, pk = decode_cursor(cursor)
+    same_position = SimpleNamespace(
+        pk=pk,
+        pub_date=pub_date.astimezone(timezone(timedelta(hours=3))),
+    )
+    other_cursor = encode_cursor(same_position)
+    assert other_cursor != cursor
+    with CaptureQueriesContext(connection) as context:
+        client.get("/", {"after": other_cursor})
+    assert not any(
+        'FROM "blog_post"' in query["sql"]
+        for query in context.captured_queries
+    ), (
+        "Убедитесь, что ключ кэша строится по позиции курсора, "
+        "а не по исходной строке запроса."
+    )